@@ -36,8 +36,9 @@ def main():
     args = parse_args()
     # Get habit page based on type provided
     page_type = args.type
-    record = habits.get_habit_page(page_type)
-    record.commit()
+    with habits.create_client() as client:
+        record = habits.get_habit_page(page_type, client=client)
+        record.commit()
     logger.info(f"Created {page_type} habit record: {record.id}")
 
 
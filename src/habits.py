@@ -6,6 +6,8 @@ Module to create Notion records for habit tracker databases.
 
 # Base imports
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from logging import getLogger, Logger
 from datetime import date
 
@@ -34,16 +36,14 @@ ANALYTICS_DB_NAME: str = "Discipline Analytics"
 """str: Name of the database for habit analytics"""
 
 
-def get_habit_page(page_type: str) -> NotionRecord:
-    """Get a page on the relevant habit database
-
-    Args:
-        page_type (str): Daily or Weekly habit page
+def create_client() -> NotionClient:
+    """Create Notion client using API key from environment
 
     Raises:
         EnvironmentError: Missing Notion API key in environment
-        LookupError: Unable to identify page type record for habits
-        LookupError: Unable to identify summary page identifier from analytics database
+
+    Returns:
+        NotionClient: Client connected to Notion API
     """
     # Load and confirm API key available
     api_key = os.getenv("NOTION_API_KEY")
@@ -51,18 +51,39 @@ def get_habit_page(page_type: str) -> NotionRecord:
         raise EnvironmentError("No Notion API key available")
 
     # Connect to Notion API
-    client = NotionClient(api_key=api_key)
+    return NotionClient(api_key=api_key)
 
-    # Validate period is defined in configuration
-    if page_type not in RECORD_TYPES:
-        raise LookupError(f"Unable to identify record for {page_type} habits")
 
-    # Get and validate parent database ID from environment
-    period_record = RECORD_TYPES[page_type]
-    parent_db_name = period_record["parent"]
-    logger.info(f"Adding habit record to parent database: {parent_db_name}")
+@lru_cache(maxsize=1)
+def get_client() -> NotionClient:
+    """Get shared Notion client created from environment
+
+    Note:
+        Client is cached to reuse pooled connections across calls, so
+        callers should not close it
+
+    Raises:
+        EnvironmentError: Missing Notion API key in environment
+
+    Returns:
+        NotionClient: Client connected to Notion API
+    """
+    return create_client()
+
+
+def _get_summary_page(client: NotionClient, parent_db_name: str) -> str:
+    """Get summary page for parent database from analytics database
+
+    Args:
+        client (NotionClient): Client connected to Notion API
+        parent_db_name (str): Name of parent habit database
+
+    Raises:
+        LookupError: Unable to identify summary page identifier from analytics database
 
-    # Connect to Notion databases
+    Returns:
+        str: Identifier for summary page
+    """
     analytics_db = client.get_database(database_name=ANALYTICS_DB_NAME)
     summary_results = analytics_db.query(
         params={
@@ -75,9 +96,56 @@ def get_habit_page(page_type: str) -> NotionRecord:
         })
     if not summary_results:
         raise LookupError(f"No summary page found for {parent_db_name}")
-    else:
-        summary_page = summary_results[0].id
+    return summary_results[0].id
+
+
+def get_habit_page(page_type: str, client: NotionClient = None) -> NotionRecord:
+    """Get a page on the relevant habit database
+
+    Args:
+        page_type (str): Daily or Weekly habit page
+        client (NotionClient, optional): Client to use for requests, created from
+            environment if not specified.
+
+    Raises:
+        EnvironmentError: Missing Notion API key in environment
+        LookupError: Unable to identify page type record for habits
+        LookupError: Unable to identify summary page identifier from analytics database
+    """
+    # Connect to Notion API if no client provided
+    if client is None:
+        client = get_client()
+
+    # Validate period is defined in configuration
+    if page_type not in RECORD_TYPES:
+        raise LookupError(f"Unable to identify record for {page_type} habits")
+
+    # Get and validate parent database ID from environment
+    period_record = RECORD_TYPES[page_type]
+    parent_db_name = period_record["parent"]
+    logger.info(f"Adding habit record to parent database: {parent_db_name}")
+
+    # Resolve parent database, listing databases for summary lookup
     database = client.get_database(database_name=parent_db_name)
+    if page_type == "weekly":
+        # For weekly habit tasks, get latest week to link while summary resolves
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            summary_future = executor.submit(
+                _get_summary_page, client, parent_db_name)
+            prior_results = database.query(
+                params={
+                    "page_size": 1,
+                    "sorts": [
+                        {
+                            "property": "Date",
+                            "direction": "descending",
+                        }
+                    ]
+                })
+            summary_page = summary_future.result()
+    else:
+        summary_page = _get_summary_page(client, parent_db_name)
+
     # Create instance of Notion record and set date
     today = date.today()
     record = database.new_record(
@@ -88,20 +156,9 @@ def get_habit_page(page_type: str) -> NotionRecord:
 
     # Make weekly-specifc updates
     if page_type == "weekly":
-        # For weekly habit tasks, get latest week to link
-        results = database.query(
-            params={
-                "page_size": 1,
-                "sorts": [
-                    {
-                        "property": "Date",
-                        "direction": "descending",
-                    }
-                ]
-            })
         # Update record with prior week details
-        record.prior_weekly_discipline = results[0].id
-        record.days = results[0].days
+        record.prior_weekly_discipline = prior_results[0].id
+        record.days = prior_results[0].days
 
     # Provide page to commit
     return record
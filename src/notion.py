@@ -7,17 +7,36 @@ and manage field interactions.
 
 # Base imports
 import re
+import threading
+from functools import lru_cache
 from logging import getLogger, Logger
 from datetime import date, datetime
 import enum
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable
 
 # PyPI imports
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+# Optional faster JSON serialization, falling back to standard library
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 logger: Logger = getLogger(__name__)
 
+_SLUG_STRIP: re.Pattern = re.compile(r"[^\w\s-]")
+"""re.Pattern: Characters removed from slugs"""
+_SLUG_SEP: re.Pattern = re.compile(r"[-\s]+")
+"""re.Pattern: Separators replaced in slugs"""
+_GUID_RE: re.Pattern = re.compile(r"\w{8}\-\w{4}\-\w{4}\-\w{4}\-\w{12}")
+"""re.Pattern: Format of Notion identifier for relation fields"""
+
 
+@lru_cache(maxsize=512)
 def get_slug(value: str) -> str:
     """Convert string to snake case property slug
 
@@ -27,8 +46,8 @@ def get_slug(value: str) -> str:
     Returns:
         str: Slugified field name for property
     """
-    value = re.sub(r'[^\w\s-]', '', value).strip().lower()
-    value = re.sub(r'[-\s]+', '_', value)
+    value = _SLUG_STRIP.sub('', value).strip().lower()
+    value = _SLUG_SEP.sub('_', value)
     return value
 
 
@@ -37,6 +56,33 @@ class NotionException(Exception):
     pass
 
 
+class _NotionRetry(Retry):
+    """Retry policy which only resends page writes when rate limited
+
+    Note:
+        Notion may have processed a page write before a read or server error,
+        so resending it could create a duplicate page
+    """
+
+    PAGES_PATH = "/v1/pages"
+    """str: Path of page endpoints not to resend after errors"""
+
+    def increment(self, method: str = None, url: str = None, response=None,
+                  error: Exception = None, _pool=None, _stacktrace=None) -> "_NotionRetry":
+        """Return incremented retry policy, exhausted for unsafe page retries
+
+        Raises:
+            MaxRetryError: Retries exhausted or page write unsafe to resend
+        """
+        rate_limited = response is not None and response.status == 429
+        not_sent = error is not None and self._is_connection_error(error)
+        if url and url.startswith(self.PAGES_PATH) and not (rate_limited or not_sent):
+            # Exhaust retries to return response or raise error
+            return super(_NotionRetry, self.new(total=0)).increment(
+                method, url, response, error, _pool, _stacktrace)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
 class NotionClient:
     """Notion API interface for integrations"""
 
@@ -44,6 +90,8 @@ class NotionClient:
     """str: Base link for API endpoints"""
     API_VERSION = "2022-06-28"
     """str: API version to use in requests"""
+    TIMEOUT = 30.0
+    """float: Seconds to wait for API connection and response"""
     METADATA_FIELDS = ["id", "url", "created_time", "last_edited_time"]
     """list[str]: Metadata fields related to all Notion objects"""
 
@@ -53,7 +101,43 @@ class NotionClient:
         Args:
             api_key (str): Internal secret API key from Notion integration 
         """
-        self.__api_key = api_key
+        # Persistent session to reuse connections across requests
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Notion-Version": self.API_VERSION,
+            "Content-Type": "application/json",
+        })
+        # Retry rate limited and transient server errors with backoff,
+        # returning final response to raise from status check
+        retry = _NotionRetry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET", "POST", "PATCH"),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry))
+        # Databases already loaded, keyed by identifier or name
+        self._db_cache: dict[str, NotionDatabase] = {}
+        # Database identifiers by name from a single search, loaded on demand
+        self._databases: dict[str, str] | None = None
+        self._databases_lock = threading.Lock()
+
+    def __enter__(self) -> "NotionClient":
+        """Use client as context manager to close session on exit"""
+        return self
+
+    def __exit__(self, *args):
+        """Close client session when leaving context"""
+        self.close()
+
+    def close(self):
+        """Close the underlying HTTP session and pooled connections"""
+        self._session.close()
 
     def request(self, endpoint: str, method: str, payload: dict = None) -> dict:
         """Make request to Notion API
@@ -69,22 +153,48 @@ class NotionClient:
         Returns:
             dict: Parsed API response
         """
-        # Call Notion API with arguments and headers
-        response = requests.api.request(
-            url=self.BASE_URL + endpoint,
+        # Call Notion API with serialized payload using session headers
+        response = self._session.request(
             method=method,
-            json=payload,
-            headers={
-                "Authorization": f"Bearer {self.__api_key}",
-                "Notion-Version": self.API_VERSION,
-            }
+            url=self.BASE_URL + endpoint,
+            data=_json.dumps(payload) if payload is not None else None,
+            timeout=self.TIMEOUT,
         )
         # Validate and parse response or raise exception
         if response.ok:
-            return response.json()
+            return _json.loads(response.content)
         else:
             raise requests.RequestException(response.text, response=response)
 
+    def list_databases(self) -> dict[str, str]:
+        """Get all databases shared with the integration from a single search
+
+        Note:
+            Results are cached on the client after the first call
+
+        Returns:
+            dict[str, str]: Database identifiers keyed by name
+        """
+        # Lock so concurrent lookups share one search request
+        with self._databases_lock:
+            if self._databases is None:
+                databases = dict()
+                params = {
+                    "filter": {"property": "object", "value": "database"},
+                    "page_size": 100,
+                }
+                while True:
+                    result = self.request("/search", "POST", params)
+                    for d in result["results"]:
+                        name = "".join(t["plain_text"] for t in d["title"])
+                        databases.setdefault(name, d["id"])
+                    # Page through results only if needed
+                    if not result.get("has_more"):
+                        break
+                    params = {**params, "start_cursor": result["next_cursor"]}
+                self._databases = databases
+        return self._databases
+
     def get_database(self, database_id: str = None, database_name: str = None) -> "NotionDatabase":
         """Get Notion database object using client integration
 
@@ -98,22 +208,41 @@ class NotionClient:
         Raises:
             NotionException: No database found with provided identifier or name
         """
+        # Return previously loaded database if available
+        key = database_id or f"name:{database_name}"
+        if key in self._db_cache:
+            return self._db_cache[key]
+
         # Get database using client and identifier
+        database = None
         if database_id:
-            return NotionDatabase(client=self, id=database_id)
+            database = NotionDatabase(client=self, id=database_id)
         elif database_name:
-            result = self.request("/search", "POST", {
-                "query": database_name,
-                "filter": {"property": "object", "value": "database"},
-            })
-            matched_results = [
-                d for d
-                in result["results"]
-                if "".join(t["plain_text"] for t in d["title"]) == database_name
-            ]
-            if matched_results:
-                return NotionDatabase(client=self, id=matched_results[0]["id"])
-        raise NotionException("No database found with provided identifier or name")
+            listed_id = self.list_databases().get(database_name)
+            if listed_id:
+                database = NotionDatabase(client=self, id=listed_id)
+            else:
+                # Fall back to searching by name for databases not listed
+                result = self.request("/search", "POST", {
+                    "query": database_name,
+                    "filter": {"property": "object", "value": "database"},
+                })
+                match = next(
+                    (d for d in result["results"]
+                     if "".join(t["plain_text"] for t in d["title"]) == database_name),
+                    None,
+                )
+                if match:
+                    database = NotionDatabase(client=self, id=match["id"])
+        if not database:
+            raise NotionException("No database found with provided identifier or name")
+
+        # Cache database by identifier and name for later lookups
+        self._db_cache[database.id] = database
+        if database_name:
+            self._db_cache[key] = database
+        return database
+
 
 class NotionDatabase:
     """Structured set of Notion pages with defined properties"""
@@ -128,9 +257,14 @@ class NotionDatabase:
         # Set basic attributes
         self._id = id
         self.client = client
+        self._title_property_name = None
+        # Properties loaded from API on first access
+        self._loaded = False
 
-        # Load properties from API
-        self._load_properties()
+    def _ensure_loaded(self):
+        """Load properties from API if not yet retrieved"""
+        if not self._loaded:
+            self._load_properties()
 
     def _load_properties(self):
         """Retrieve and store properties defined for database"""
@@ -143,11 +277,19 @@ class NotionDatabase:
             setattr(self, "_" + field, details[field])
 
         # Parse text-based attributes
-        self.title = FieldType.TITLE.parse(details["title"])
-        self.description = FieldType.RICH_TEXT.parse(details["description"])
+        self._title = FieldType.TITLE.parse(details["title"])
+        self._description = FieldType.RICH_TEXT.parse(details["description"])
 
-        # Assign properties to attribute
+        # Assign properties to attribute and cache slugified schema
         self._properties = details["properties"]
+        self._slug_properties = MappingProxyType({
+            get_slug(k): v for k, v in self._properties.items()})
+        self._name_by_slug = {
+            slug: v["name"] for slug, v in self._slug_properties.items()}
+        # Store name of title property to find it directly on records
+        self._title_property_name = next(
+            (k for k, v in self._properties.items() if v["type"] == "title"), None)
+        self._loaded = True
 
     @property
     def id(self) -> str:
@@ -162,13 +304,44 @@ class NotionDatabase:
         return self._id
 
     @property
-    def properties(self) -> dict[str, str]:
-        """Slugified database properties (schema)
+    def title(self) -> str:
+        """Title of database, loaded on first access
+
+        Returns:
+            str: Database title
+        """
+        self._ensure_loaded()
+        return self._title
+
+    @property
+    def description(self) -> str:
+        """Description of database, loaded on first access
+
+        Returns:
+            str: Database description
+        """
+        self._ensure_loaded()
+        return self._description
+
+    @property
+    def properties(self) -> MappingProxyType:
+        """Slugified database properties (schema), loaded on first access
 
         Returns:
-            dict[str, str]: Database properties
+            MappingProxyType: Read-only database properties
         """
-        return {get_slug(k): v for k, v in self._properties.items()}
+        self._ensure_loaded()
+        return self._slug_properties
+
+    @property
+    def display_names(self) -> dict[str, str]:
+        """Display names of database properties by slug, loaded on first access
+
+        Returns:
+            dict[str, str]: Property display names
+        """
+        self._ensure_loaded()
+        return self._name_by_slug
 
     def query(self, params: dict) -> list["NotionRecord"]:
         """Query a Notion database with parameters
@@ -218,6 +391,9 @@ class NotionRecord:
         # Set initial properties
         self._id = None
         self._parent = parent
+        # Raw API properties parsed on access, keyed by slug
+        self._raw_properties = dict()
+        self._raw_names = dict()
         # Set name as Notion Field object
         self.name = NotionField(record=self, name="name",
                                 value=name, field_type="title")
@@ -236,9 +412,13 @@ class NotionRecord:
         Returns:
             NotionRecord: Record created from API response
         """
-        # Get title property (often 'Name')
-        title_property = [
-            v for v in payload["properties"].values() if v["type"] == "title"][0]
+        # Get title property (often 'Name'), scanning if name not yet known
+        title_property = payload["properties"].get(parent._title_property_name)
+        if title_property is None:
+            title_name, title_property = next(
+                (k, v) for k, v in payload["properties"].items() if v["type"] == "title")
+            # Store title name on database for direct lookup on next record
+            parent._title_property_name = title_name
         title_value = FieldType.TITLE.parse(title_property["title"])
 
         # Create record instance
@@ -253,20 +433,52 @@ class NotionRecord:
                 value = datetime.fromisoformat(payload[field])
             setattr(record, "_" + field, value)
 
-        # Parse properties from query result payload
-        properties = dict()
-        for property, details in payload["properties"].items():
-            field = NotionField.from_api(
-                record=record, name=property, details=details)
-            properties[field.name] = field
-
-        # Assign record field properties
-        for property, value in properties.items():
-            if property != "name":
-                setattr(record, property, value)
+        # Store properties from query result payload to parse on access
+        record._raw_properties = payload["properties"]
+        record._raw_names = {
+            get_slug(property): property for property in payload["properties"]}
 
         return record
 
+    def __getattr__(self, name: str) -> "NotionField":
+        """Parse record field from API payload on first access
+
+        Args:
+            name (str): Slugified name of field
+
+        Raises:
+            AttributeError: No field with name on record
+
+        Returns:
+            NotionField: Field parsed from API payload
+        """
+        if name not in self.__dict__.get("_raw_names", {}):
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'")
+        return self._parse_field(name)
+
+    def materialize_all(self):
+        """Parse all fields from API payload not yet accessed or assigned"""
+        for name in self._raw_names:
+            if name not in self.__dict__:
+                self._parse_field(name)
+
+    def _parse_field(self, name: str) -> "NotionField":
+        """Parse field from API payload and cache it on record
+
+        Args:
+            name (str): Slugified name of field in payload
+
+        Returns:
+            NotionField: Field parsed from API payload
+        """
+        property = self._raw_names[name]
+        field = NotionField.from_api(
+            record=self, name=property, details=self._raw_properties[property])
+        # Assign directly to skip lookup on next access
+        object.__setattr__(self, name, field)
+        return field
+
     @property
     def id(self) -> str:
         """Getter method for ID property
@@ -286,9 +498,18 @@ class NotionRecord:
         Returns:
             dict: Fields and values for record
         """
-        return {
-            var: val for var, val in vars(self).items() if var[0] != "_"
-        }
+        self.materialize_all()
+        return dict(self._iter_fields())
+
+    def _iter_fields(self):
+        """Iterate public record fields in a single pass
+
+        Yields:
+            tuple[str, Any]: Field name and value
+        """
+        for var, val in self.__dict__.items():
+            if var[0] != "_":
+                yield var, val
 
     def asdict(self) -> dict:
         """Public fields with values returned directly
@@ -311,7 +532,7 @@ class NotionRecord:
         Returns:
             list[Any]: Values from Notion fields
         """
-        return [val for _, val in self.fields]
+        return list(self.fields.values())
 
     def _get_api_body(self) -> dict:
         """Structure record data for API requests
@@ -320,20 +541,23 @@ class NotionRecord:
             dict: Representation of Notion Record for API requests
         """
         properties = dict()
+        fields = self.fields
+        display_names = self._parent.display_names
 
         # Check for record properties not on database
-        invalid_properties = [
-            k for k in self.fields.keys() if k not in self._parent.properties]
+        invalid_properties = [k for k in fields.keys() if k not in display_names]
         if invalid_properties:
             raise NotionException(f"Record properties do not exist on parent database: {
                                   ', '.join(invalid_properties)}")
 
         # Format all NotionField properties for API requests
-        for var, val in self.fields.items():
-            if not isinstance(val, NotionField):
-                val = NotionField(record=self, name=var, value=val)
+        for var, val in fields.items():
             # Add API-formatted field to body dictionary
-            properties = {**properties, **val.get_api_format()}
+            if isinstance(val, NotionField):
+                properties[val.display_name] = val._api_body
+            else:
+                properties[display_names[var]] = _build_api_body(
+                    FieldType.detect(val), val)
 
         body = {
             "properties": properties,
@@ -404,10 +628,8 @@ class NotionField:
         name = get_slug(name)
         # Get field type to parse value
         field_type = FieldType(details["type"])
-        if details[field_type.value]:
-            field_value = field_type.parse(details[field_type.value])
-        else:
-            field_value = None
+        raw = details.get(field_type.value)
+        field_value = field_type.parse(raw) if raw else None
         # Return class instance
         return cls(record=record, name=name, value=field_value, field_type=field_type)
 
@@ -428,7 +650,7 @@ class NotionField:
         Returns:
             str: Formatted field name
         """
-        return self._record._parent.properties[self.name]["name"]
+        return self._record._parent.display_names[self.name]
 
     @property
     def _api_body(self) -> dict:
@@ -437,43 +659,7 @@ class NotionField:
         Returns:
             dict: API structure for field based on type
         """
-        if self.type == FieldType.TITLE:
-            return {
-                "title": [
-                    {
-                        "text": {
-                            "content": self.value,
-                        }
-                    }
-                ]
-            }
-        elif self.type == FieldType.RICH_TEXT:
-            return {
-                "rich_text": [
-                    {
-                        "text": {
-                            "content": self.value,
-                        }
-                    }
-                ]
-            }
-        elif self.type == FieldType.DATE:
-            return {
-                "date": {
-                    "start": self.value.isoformat(),
-                }
-            }
-        elif self.type == FieldType.RELATION:
-            return {
-                "relation": [{
-                    "id": self.value,
-                }]
-            }
-        else:
-            # fallback to type: value
-            return {
-                self.type.value: self.value,
-            }
+        return _build_api_body(self.type, self.value)
 
 
 class FieldType(enum.Enum):
@@ -509,23 +695,9 @@ class FieldType(enum.Enum):
         Returns:
             FieldType: Enum instance value matching value
         """
-        # Format of Notion identifier for relation fields
-        GUID_FORMAT = r"\w{8}\-\w{4}\-\w{4}\-\w{4}\-\w{12}"
-        # Return enum value based on variable type
-        if isinstance(value, (date, datetime)):
-            return cls.DATE
-        elif isinstance(value, str):
-            # Detect GUID format used for links
-            if re.match(GUID_FORMAT, value):
-                return cls.RELATION
-            else:
-                return cls.RICH_TEXT
-        elif isinstance(value, bool):
-            return cls.CHECKBOX
-        elif isinstance(value, list):
-            return cls.MULTI_SELECT
-        elif isinstance(value, (int, float)):
-            return cls.NUMBER
+        # Return enum value based on exact variable type, then base types
+        handler = _TYPE_DISPATCH.get(type(value)) or _base_type_handler(type(value))
+        return handler(value) if handler else None
 
     def parse(self, details: dict | bool) -> Any:
         """Parse Notion API payload based on field type
@@ -537,16 +709,90 @@ class FieldType(enum.Enum):
             Any: Value of parsed field with type converted
         """
         # Parse values based on field type
-        if self.value == "date":
-            return date.fromisoformat(details["start"])
-        elif self.value == "created_by":
-            return details["id"]
-        elif self.value in ("title", "rich_text"):
-            return "".join(t["plain_text"] for t in details)
-        elif self.value == "relation":
-            return [r["id"] for r in details]
-        elif self.value in ("formula", "rollup"):
-            return details[details["type"]]
-        else:
-            # Simple values or adapters not identified
-            return details
+        parser = _PARSERS.get(self)
+        if parser:
+            return parser(details)
+        # Simple values or adapters not identified
+        return details
+
+
+_PARSERS: dict[FieldType, Callable[[Any], Any]] = {
+    FieldType.DATE: lambda d: date.fromisoformat(d["start"]),
+    FieldType.CREATED_BY: lambda d: d["id"],
+    FieldType.TITLE: lambda d: "".join(t["plain_text"] for t in d),
+    FieldType.RICH_TEXT: lambda d: "".join(t["plain_text"] for t in d),
+    FieldType.RELATION: lambda d: [r["id"] for r in d],
+    FieldType.FORMULA: lambda d: d[d["type"]],
+    FieldType.ROLLUP: lambda d: d[d["type"]],
+}
+"""dict[FieldType, Callable]: Parsers for API values by field type"""
+
+_API_BUILDERS: dict[FieldType, Callable[[Any], dict]] = {
+    FieldType.TITLE: lambda v: {"title": [{"text": {"content": v}}]},
+    FieldType.RICH_TEXT: lambda v: {"rich_text": [{"text": {"content": v}}]},
+    FieldType.DATE: lambda v: {"date": {"start": v.isoformat()}},
+    FieldType.RELATION: lambda v: {"relation": [{"id": v}]},
+}
+"""dict[FieldType, Callable]: API body builders for values by field type"""
+
+
+def _detect_str(value: str) -> FieldType:
+    """Determine type of Notion field for string value
+
+    Args:
+        value (str): Value of field to detect from
+
+    Returns:
+        FieldType: Relation for Notion identifiers, otherwise rich text
+    """
+    # Detect GUID format used for links
+    if len(value) == 36 and _GUID_RE.match(value):
+        return FieldType.RELATION
+    return FieldType.RICH_TEXT
+
+
+_TYPE_DISPATCH: dict[type, Callable[[Any], FieldType]] = {
+    date: lambda v: FieldType.DATE,
+    datetime: lambda v: FieldType.DATE,
+    bool: lambda v: FieldType.CHECKBOX,
+    int: lambda v: FieldType.NUMBER,
+    float: lambda v: FieldType.NUMBER,
+    list: lambda v: FieldType.MULTI_SELECT,
+    str: _detect_str,
+}
+"""dict[type, Callable]: Field type detection by value type"""
+
+
+@lru_cache(maxsize=128)
+def _base_type_handler(value_type: type) -> Callable[[Any], FieldType] | None:
+    """Find field type detection handler for subclass of a supported type
+
+    Args:
+        value_type (type): Type of field value
+
+    Returns:
+        Callable | None: Handler of nearest base type, if supported
+    """
+    for base in value_type.__mro__[1:]:
+        if base in _TYPE_DISPATCH:
+            return _TYPE_DISPATCH[base]
+    return None
+
+
+def _build_api_body(field_type: FieldType, value: Any) -> dict:
+    """Generate API body structure for a field value
+
+    Args:
+        field_type (FieldType): Type of Notion field
+        value (Any): Value of Notion field
+
+    Returns:
+        dict: API structure for field based on type
+    """
+    builder = _API_BUILDERS.get(field_type)
+    if builder:
+        return builder(value)
+    # fallback to type: value
+    return {
+        field_type.value: value,
+    }
@@ -4,8 +4,11 @@ import os
 # PyPI imports
 import pytest
 
+# Local imports
+from src.notion import NotionClient
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def api_key() -> str:
     api_key = os.getenv("NOTION_API_KEY")
     if not api_key:
@@ -13,6 +16,12 @@ def api_key() -> str:
     return api_key
 
 
+@pytest.fixture(scope="session")
+def client(api_key: str) -> NotionClient:
+    with NotionClient(api_key=api_key) as client:
+        yield client
+
+
 @pytest.fixture
 def page_schema() -> dict:
     return {
@@ -1,22 +1,72 @@
 # Base imports
 import json
 import logging
+from datetime import date, datetime
+from enum import IntEnum
 
 # PyPI imports
+import pytest
 from jsonschema import validate
+from urllib3 import HTTPResponse
+from urllib3.exceptions import MaxRetryError, ReadTimeoutError
 
 # Local imports
-from src.notion import NotionClient, NotionRecord
+from src.notion import (
+    NotionClient, NotionDatabase, NotionRecord, NotionField, FieldType)
 from src.habits import get_habit_page, RECORD_TYPES
 
 
-def test_query_database(api_key: str, page_type: str):
+class Rating(IntEnum):
+    LOW = 1
+
+
+class Label(str):
+    pass
+
+
+class StubClient(NotionClient):
+    """Client returning canned API responses and recording requests"""
+
+    QUERY_RESULT = {
+        "id": "page-1",
+        "url": "https://www.notion.so/page-1",
+        "created_time": "2024-01-01T00:00:00+00:00",
+        "last_edited_time": "2024-01-01T00:00:00+00:00",
+        "properties": {
+            "Name": {"type": "title", "title": [{"plain_text": "Week 1"}]},
+            "Days": {"type": "number", "number": 3},
+            "Date": {"type": "date", "date": {"start": "2024-01-01"}},
+        },
+    }
+
+    def __init__(self):
+        super().__init__(api_key="test")
+        self.requests = []
+
+    def request(self, endpoint: str, method: str, payload: dict = None) -> dict:
+        self.requests.append((endpoint, payload))
+        if endpoint.endswith("/query"):
+            return {"results": [self.QUERY_RESULT]}
+        if endpoint == "/search" and "start_cursor" not in payload:
+            return {
+                "results": [{"id": "db-1", "title": [{"plain_text": "Daily"}]}],
+                "has_more": True,
+                "next_cursor": "cursor-1",
+            }
+        if endpoint == "/search":
+            return {
+                "results": [{"id": "db-2", "title": [{"plain_text": "Weekly"}]}],
+                "has_more": False,
+            }
+        raise AssertionError(f"Unexpected request: {method} {endpoint}")
+
+
+def test_query_database(client: NotionClient, page_type: str):
 
     # GIVEN
     # Get weekly database identifier from environment
     db_name = RECORD_TYPES[page_type]["parent"]
     page_size = 5
-    client = NotionClient(api_key=api_key)
     database = client.get_database(database_name=db_name)
 
     # WHEN
@@ -31,14 +81,136 @@ def test_query_database(api_key: str, page_type: str):
     assert len(results) == page_size
 
 
-def test_habit_record(page_schema: dict, page_type: str):
+@pytest.mark.parametrize("value, field_type", [
+    (date(2024, 1, 1), FieldType.DATE),
+    (datetime(2024, 1, 1, 12), FieldType.DATE),
+    (True, FieldType.CHECKBOX),
+    (3, FieldType.NUMBER),
+    (2.5, FieldType.NUMBER),
+    (["a", "b"], FieldType.MULTI_SELECT),
+    ("Notes", FieldType.RICH_TEXT),
+    ("10140b50-0f0d-43d2-905a-7ed714ef7f2c", FieldType.RELATION),
+    (Rating.LOW, FieldType.NUMBER),
+    (Label("Notes"), FieldType.RICH_TEXT),
+])
+def test_detect_field_type(value, field_type: FieldType):
+
+    # GIVEN
+    # Field value of a specific Python type
+
+    # WHEN
+    # Detect Notion field type from value
+    detected = FieldType.detect(value)
+
+    # THEN
+    # Validate detected type matches expected
+    assert detected == field_type
+
+
+def test_record_values():
+
+    # GIVEN
+    # New record with a field value assigned
+    record = NotionRecord(name="Test Record", parent=None)
+    record.days = 3
+
+    # WHEN
+    # Get list of record field values
+    values = record.values
+
+    # THEN
+    # Validate values include title field and assigned value
+    assert isinstance(values[0], NotionField)
+    assert values[0].value == "Test Record"
+    assert values[1] == 3
+
+
+def test_record_lazy_fields():
+
+    # GIVEN
+    # Record parsed from a database query result
+    client = StubClient()
+    database = NotionDatabase(client=client, id="db-1")
+    record = database.query(params={})[0]
+
+    # WHEN
+    # Access a field and check which fields have been parsed
+    parsed_before = "days" in vars(record)
+    days = record.days
+    parsed_after = "days" in vars(record)
+
+    # THEN
+    # Validate field parsed on first access and cached on record
+    assert not parsed_before
+    assert isinstance(days, NotionField)
+    assert days.value == 3
+    assert parsed_after and record.days is days
+    assert "date" not in vars(record)
+    with pytest.raises(AttributeError):
+        record.missing_field
+    # Validate all payload properties returned without schema request
+    assert record.asdict() == {
+        "name": "Week 1", "days": 3, "date": date(2024, 1, 1)}
+    assert set(record.fields) == {"name", "days", "date"}
+    assert [endpoint for endpoint, _ in client.requests] == [
+        "/databases/db-1/query"]
+
+
+def test_list_databases():
+
+    # GIVEN
+    # Client with databases shared across two pages of search results
+    client = StubClient()
+
+    # WHEN
+    # List databases and look one up by name
+    databases = client.list_databases()
+    database = client.get_database(database_name="Weekly")
+
+    # THEN
+    # Validate both pages searched once and databases resolved from listing
+    assert databases == {"Daily": "db-1", "Weekly": "db-2"}
+    assert database.id == "db-2"
+    assert [payload.get("start_cursor") for _, payload in client.requests] == [
+        None, "cursor-1"]
+
+
+def test_page_write_retries():
+
+    # GIVEN
+    # Client with retry policy mounted on session
+    client = NotionClient(api_key="test")
+    page_adapter = client._session.get_adapter(NotionClient.BASE_URL + "/pages")
+    search_adapter = client._session.get_adapter(NotionClient.BASE_URL + "/search")
+    retry = page_adapter.max_retries
+
+    # WHEN
+    # Increment retries for page writes and searches
+    rate_limited = retry.increment(
+        "POST", "/v1/pages", response=HTTPResponse(status=429))
+    search_error = retry.increment(
+        "POST", "/v1/search", response=HTTPResponse(status=503))
+
+    # THEN
+    # Validate page writes share connection pool and only retry when rate limited
+    assert page_adapter is search_adapter
+    assert rate_limited.total == retry.total - 1
+    assert search_error.total == retry.total - 1
+    with pytest.raises(MaxRetryError):
+        retry.increment("POST", "/v1/pages", response=HTTPResponse(status=500))
+    with pytest.raises(MaxRetryError):
+        retry.increment(
+            "POST", "/v1/pages", error=ReadTimeoutError(None, "/v1/pages", "timeout"))
+
+
+def test_habit_record(client: NotionClient, page_schema: dict, page_type: str):
 
     # GIVEN
     # Get configurations based on page type
 
     # WHEN
     # Get habit Notion record object
-    record = get_habit_page(page_type)
+    record = get_habit_page(page_type, client=client)
     api_body = record._get_api_body()
 
     # THEN